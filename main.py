@@ -7,11 +7,24 @@ import pygame
 import sys
 import os
 import random
+import array
+
+# Module-level aliases for pygame functions/constants used every frame
+# (one global lookup instead of a dotted attribute chain)
+_get_pressed = pygame.key.get_pressed
+_draw_rect = pygame.draw.rect
+K_LEFT, K_RIGHT, K_UP, K_SPACE = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_SPACE
+_rand = random.random
+
+# Precomputed bounce jitter, cycled through on ball/dog hits instead of calling random.uniform
+_JITTER = array.array('f', [random.uniform(0, 2) for _ in range(256)])
+_jitter_i = 0
 
 # --- Constants ---
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+MENU_FPS = 30 # Menus are mostly static and don't need the full game frame rate
 
 # Colors
 WHITE = (255, 255, 255)
@@ -28,6 +41,10 @@ NET_HEIGHT = 150
 NET_WIDTH = 10
 NET_X = SCREEN_WIDTH // 2 - NET_WIDTH // 2
 NET_RECT = pygame.Rect(NET_X, GROUND_Y - NET_HEIGHT, NET_WIDTH, NET_HEIGHT)
+NET_LEFT, NET_RIGHT, NET_TOP, NET_BOTTOM = NET_RECT.left, NET_RECT.right, NET_RECT.top, NET_RECT.bottom
+
+# Ball.check_ground_collision() results (ints, so the main loop compares integers, not strings)
+SCORE_NONE, SCORE_PLAYER, SCORE_AI = 0, 1, 2
 
 # Movement Physics
 JUMP_POWER = -12  # Negative because y-axis is inverted
@@ -35,6 +52,10 @@ ACCELERATION = 0.8  # How quickly to accelerate
 DECELERATION = 0.85  # Friction/drag factor (0-1)
 MAX_SPEED = 8  # Maximum horizontal speed
 
+# Serve mechanics
+MAX_SERVE_POWER = 100  # Maximum serve power
+SERVE_POWER_RATE = 2  # How fast the power meter increases
+
 # Sprite Info (Based on wolf sprite sheet dimensions)
 SPRITE_WIDTH = 16
 SPRITE_HEIGHT = 16
@@ -86,14 +107,8 @@ def load_sprite_sheet(sheet, frame_width, frame_height):
                 y = r * frame_height
                 # Create a rect for this specific frame
                 rect = pygame.Rect(x, y, frame_width, frame_height)
-                # Extract just this frame from the sheet
-                frame = sheet.subsurface(rect)
-                # Create a new surface with per-pixel alpha to ensure clean isolation
-                clean_frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                # Copy the frame to the new surface
-                clean_frame.blit(frame, (0, 0))
-                # Add the clean frame to our row
-                row_frames.append(clean_frame)
+                # Copy this frame out of the sheet into a standalone, display-format surface
+                row_frames.append(sheet.subsurface(rect).copy().convert_alpha())
             frames.append(row_frames)
         print(f"Loaded sprite sheet: {sheet_width}x{sheet_height}, {rows} rows, {cols} cols")
         return frames, sheet_width, sheet_height
@@ -125,22 +140,130 @@ def get_animation_frames(all_frames, animation_info):
     return all_frames[row_index][:actual_count]
 
 
+def scale_frames(frames, width, height):
+    """Scales animation frames once at load time so animate() can swap them directly."""
+    return [pygame.transform.scale(frame, (width, height)).convert_alpha() for frame in frames]
+
+
+# --- Physics ---
+
+def step_ball(x, y, dx, dy, gravity, w, h, screen_w, net_l, net_r, net_t, net_b):
+    """Advances the ball one frame and resolves wall, ceiling and net collisions.
+
+    Works only on plain numbers (ball center, velocity and size) and returns
+    the updated (x, y, dx, dy).
+    """
+    half_w = w / 2
+    half_h = h / 2
+
+    # Apply gravity and update position
+    dy += gravity
+    x += dx
+    y += dy
+
+    # Wall collisions
+    if x - half_w <= 0:
+        x = half_w
+        dx *= -0.9 # Bounce with slight energy loss
+    if x + half_w >= screen_w:
+        x = screen_w - half_w
+        dx *= -0.9
+
+    # Ceiling collision
+    if y - half_h <= 0:
+        y = half_h
+        dy *= -0.9
+
+    # Net collision (simple box overlap). Most frames the ball is nowhere near
+    # the net, so reject on the center's x range before building the edges.
+    if net_l - half_w < x < net_r + half_w and net_t - half_h < y < net_b + half_h:
+        left, right, top, bottom = x - half_w, x + half_w, y - half_h, y + half_h
+        # Determine hit side more accurately
+        overlap_x = min(right - net_l, net_r - left)
+        overlap_y = min(bottom - net_t, net_b - top)
+
+        if overlap_x < overlap_y: # Hit the side of the net
+            dx *= -1.1 # Bounce horizontally, maybe faster
+            # Nudge out
+            if x < (net_l + net_r) / 2:
+                x = net_l - 1 - half_w
+            else:
+                x = net_r + 1 + half_w
+        else: # Hit the top (or bottom, less likely)
+            dy *= -0.9 # Bounce vertically
+            # Nudge out
+            if y < (net_t + net_b) / 2: # Hit top
+                y = net_t - 1 - half_h
+            else: # Hit bottom (unlikely)
+                y = net_b + 1 + half_h
+
+    return x, y, dx, dy
+
+
+def compute_hit(ball_cx, dog_cx, dog_w, dog_dx, dog_dy, jitter):
+    """Returns the ball's new (dx, dy) after bouncing off a dog.
+
+    Like step_ball, works only on plain numbers; jitter is a random 0-2 bounce variation.
+    """
+    # Calculate hit angle based on relative position
+    hit_angle = (ball_cx - dog_cx) / (dog_w / 2) # -1 to 1
+
+    # Add dog's momentum to the ball
+    dx = hit_angle * 7 + (dog_dx * 0.6)  # Bounce angle depends on hit location + dog's momentum
+
+    # Stronger bounce if dog is moving up (jumping)
+    if dog_dy < 0:  # Dog is moving upward
+        dy = -10 - jitter - abs(dog_dy * 0.3)  # Extra bounce from jump
+    else:
+        dy = -8 - jitter  # Standard bounce
+
+    return dx, dy
+
+
 # --- Classes ---
 
+class GameState:
+    """Mutable game state shared by the sprites, menus and main loop."""
+    __slots__ = ('state', 'player_score', 'ai_score', 'winning_score', 'serve_side',
+                 'winner', 'serve_power', 'serve_charging', 'pause_end_ms')
+
+    def __init__(self):
+        self.state = 'start_menu' # 'start_menu', 'options', 'how_to_play', 'playing', 'serving', 'point_pause', 'game_over'
+        self.player_score = 0
+        self.ai_score = 0
+        self.winning_score = 5
+        self.serve_side = 'player' # 'player' or 'ai'
+        self.winner = None
+
+        # Serve mechanics
+        self.serve_power = 0  # Current serve power (0-100)
+        self.serve_charging = False  # Whether the player is currently charging a serve
+        self.pause_end_ms = 0  # pygame.time.get_ticks() value at which the point pause ends
+
+
 class Dog(pygame.sprite.Sprite):
-    def __init__(self, x, y, speed, animations):
+    __slots__ = ('gs', 'animations', 'state', 'frame_index', 'anim_counter', 'image', 'rect',
+                 'min_x', 'max_x', 'dx', 'dy', 'speed', 'moving_timer', 'is_jumping', 'is_grounded',
+                 'x', 'y')
+    frames_per_anim = FPS // ANIMATION_FPS # Game loop frames per animation frame (same for every dog)
+
+    def __init__(self, x, y, speed, animations, gs):
         super().__init__()
+        self.gs = gs # Shared GameState
         self.animations = animations # Dict like {'idle': [frames], 'walk': [frames], 'run': [frames]}
         self.state = 'idle' # 'idle', 'walk', 'run'
         self.frame_index = 0
-        self.last_update_time = pygame.time.get_ticks() # For animation timing
-        self.animation_delay = 1000 // ANIMATION_FPS # Milliseconds per frame
+        self.anim_counter = 0 # Game loop frames since the last animation frame change
 
-        # Scale the first frame for initial image and rect setup
-        self.image = pygame.transform.scale(self.animations['idle'][0], (DOG_DRAW_WIDTH, DOG_DRAW_HEIGHT))
+        # Frames are pre-scaled at load time, so the first idle frame is ready to use
+        self.image = self.animations['idle'][0]
         self.rect = self.image.get_rect()
         self.rect.bottomleft = (x, y) # Use bottomleft for ground alignment
 
+        # Horizontal movement bounds (subclasses keep each dog on its side of the net)
+        self.min_x = 0
+        self.max_x = SCREEN_WIDTH
+
         # Physics properties
         self.dx = 0  # Horizontal velocity
         self.dy = 0  # Vertical velocity
@@ -153,15 +276,16 @@ class Dog(pygame.sprite.Sprite):
         self.x = float(self.rect.x)
         self.y = float(self.rect.y)
 
-    def update_animation_state(self):
+    def update_animation_state(self, _walk_to_run=WALK_TO_RUN_THRESHOLD):
         """Determines the correct animation state based on movement."""
-        is_moving = abs(self.dx) > 0.1
+        dx = self.dx
+        is_moving = dx * dx > 0.01 # Same as abs(dx) > 0.1 without the call
 
         new_state = 'idle'
         if not is_moving:
             new_state = 'idle'
             self.moving_timer = 0 # Reset timer when stopped
-        elif self.moving_timer < WALK_TO_RUN_THRESHOLD:
+        elif self.moving_timer < _walk_to_run:
             new_state = 'walk'
             self.moving_timer += 1 # Increment timer while moving
         else:
@@ -174,9 +298,10 @@ class Dog(pygame.sprite.Sprite):
 
     def animate(self):
         """Cycles through the animation frames for the current state."""
-        now = pygame.time.get_ticks()
-        if now - self.last_update_time > self.animation_delay:
-            self.last_update_time = now
+        # The game loop runs at a fixed FPS, so count frames instead of querying the clock
+        self.anim_counter += 1
+        if self.anim_counter >= self.frames_per_anim:
+            self.anim_counter = 0
             frames = self.animations.get(self.state, self.animations['idle']) # Fallback to idle
             if not frames: # Handle case where animation frames might be missing
                 print(f"Warning: No frames found for state '{self.state}'. Using idle.")
@@ -186,14 +311,8 @@ class Dog(pygame.sprite.Sprite):
                      return
 
             self.frame_index = (self.frame_index + 1) % len(frames)
-            # Get the correct frame and scale it
-            new_frame = frames[self.frame_index]
-            self.image = pygame.transform.scale(new_frame, (DOG_DRAW_WIDTH, DOG_DRAW_HEIGHT))
-            # Important: Update rect center based on new image if needed,
-            # but since we scale consistently, just keeping the bottomleft aligned might be okay.
-            # Keep bottom aligned after scaling
-            bottom = self.rect.bottom
-            self.rect = self.image.get_rect(bottom=bottom, centerx=self.rect.centerx)
+            # Frames are all pre-scaled to DOG_DRAW_WIDTH x DOG_DRAW_HEIGHT, so the rect never changes size
+            self.image = frames[self.frame_index]
 
     def jump(self):
         """Make the dog jump if it's on the ground."""
@@ -203,38 +322,41 @@ class Dog(pygame.sprite.Sprite):
             self.is_grounded = False
 
     def apply_physics(self):
-        """Apply gravity and handle ground collision."""
+        """Apply gravity, friction, horizontal bounds and ground collision."""
         # Apply gravity
         self.dy += GRAVITY
 
-        # Apply horizontal deceleration (friction)
-        if abs(self.dx) > 0.1:
-            self.dx *= DECELERATION
-        else:
-            self.dx = 0  # Stop completely if very slow
+        # Apply friction (stop completely if very slow, i.e. abs(dx) <= 0.1) and cap horizontal speed
+        dx = self.dx
+        self.dx = max(-MAX_SPEED, min(MAX_SPEED, dx * DECELERATION if dx * dx > 0.01 else 0.0))
 
-        # Cap horizontal speed
-        if self.dx > MAX_SPEED:
-            self.dx = MAX_SPEED
-        elif self.dx < -MAX_SPEED:
-            self.dx = -MAX_SPEED
-
-        # Update position with velocity
-        self.x += self.dx
+        # Update float position, clamped to this dog's side of the court
+        rect = self.rect
+        self.x = max(self.min_x, min(self.max_x - rect.width, self.x + self.dx))
         self.y += self.dy
 
-        # Update rect position from float values
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
-
         # Check for ground collision
-        if self.rect.bottom >= GROUND_Y:
-            self.rect.bottom = GROUND_Y
-            self.y = float(self.rect.y)
+        ground_top = GROUND_Y - rect.height
+        if self.y >= ground_top:
+            self.y = float(ground_top)
             self.dy = 0
             self.is_grounded = True
             self.is_jumping = False
 
+        # Write the rect once from the authoritative float values
+        rect.x = int(self.x)
+        rect.y = int(self.y)
+
+    def reset(self):
+        """Resets animation and movement state (position is reset in reset_game)."""
+        self.frame_index = 0
+        self.moving_timer = 0
+        self.state = 'idle'
+        self.dx = 0
+        self.dy = 0
+        self.is_jumping = False
+        self.is_grounded = True
+
     def update(self):
         """Placeholder for movement logic - to be implemented in subclasses."""
         self.update_animation_state()
@@ -243,55 +365,71 @@ class Dog(pygame.sprite.Sprite):
 
 
 class Player(Dog):
-    def __init__(self, x, y, speed, animations):
-        super().__init__(x, y, speed, animations)
+    __slots__ = ('space_pressed_last_frame',)
+    keys = None # Keyboard state for the current frame, set once per frame by the main loop
+
+    def __init__(self, x, y, speed, animations, gs):
+        super().__init__(x, y, speed, animations, gs)
+        self.max_x = NET_X  # Player stays left of net
         self.space_pressed_last_frame = False  # Track space bar state for serve release
 
-    def update(self):
-        global game_state, serve_power, serve_charging
+    def update(self, _acceleration=ACCELERATION, _power_rate=SERVE_POWER_RATE, _max_power=MAX_SERVE_POWER):
+        # Per-frame values are bound to locals up front, and constants come in as
+        # default arguments, so the hot paths below read fast locals, not globals
+        gs = self.gs
+        state = gs.state
 
-        keys_pressed = pygame.key.get_pressed()
-        is_moving_left = keys_pressed[pygame.K_LEFT]
-        is_moving_right = keys_pressed[pygame.K_RIGHT]
-        is_up_pressed = keys_pressed[pygame.K_UP]  # Changed to up arrow for jumping
-        is_space_pressed = keys_pressed[pygame.K_SPACE]  # Space is now only for serving
+        keys_pressed = self.keys
+        is_moving_left, is_moving_right, is_up_pressed, is_space_pressed = (
+            keys_pressed[K_LEFT],
+            keys_pressed[K_RIGHT],
+            keys_pressed[K_UP],  # Up arrow for jumping
+            keys_pressed[K_SPACE],  # Space is only for serving
+        )
 
         # Handle serving state
-        if game_state == 'serving' and serve_side == 'player':
+        if state == 'serving' and gs.serve_side == 'player':
+            power = gs.serve_power
+            charging = gs.serve_charging
+
             # Start charging serve when space is pressed
-            if is_space_pressed and not serve_charging:
-                serve_charging = True
-                serve_power = 0
+            if is_space_pressed and not charging:
+                charging = True
+                power = 0
 
             # Continue charging while space is held
-            elif is_space_pressed and serve_charging:
-                serve_power = min(serve_power + SERVE_POWER_RATE, MAX_SERVE_POWER)
+            elif is_space_pressed and charging:
+                power = min(power + _power_rate, _max_power)
 
             # Release serve when space is released after charging
-            elif not is_space_pressed and serve_charging and self.space_pressed_last_frame:
-                serve_charging = False
+            elif not is_space_pressed and charging and self.space_pressed_last_frame:
+                charging = False
                 # Serve the ball with the charged power
-                ball.serve_with_power(serve_side, serve_power)
-                game_state = 'playing'
-                serve_power = 0  # Reset serve power
+                ball.serve_with_power(gs.serve_side, power)
+                gs.state = 'playing'
+                power = 0  # Reset serve power
+
+            # Write back once; serving is the only branch that changes them
+            gs.serve_power = power
+            gs.serve_charging = charging
 
             # Allow movement during serving
             if is_moving_left:
-                self.dx -= ACCELERATION  # Accelerate left
+                self.dx -= _acceleration  # Accelerate left
             elif is_moving_right:
-                self.dx += ACCELERATION  # Accelerate right
+                self.dx += _acceleration  # Accelerate right
 
         # Normal gameplay controls
-        elif game_state == 'playing':
+        elif state == 'playing':
             # Handle jumping with UP arrow
             if is_up_pressed:
                 self.jump()
 
             # Apply acceleration based on input
             if is_moving_left:
-                self.dx -= ACCELERATION  # Accelerate left
+                self.dx -= _acceleration  # Accelerate left
             elif is_moving_right:
-                self.dx += ACCELERATION  # Accelerate right
+                self.dx += _acceleration  # Accelerate right
 
         # Update space bar state for next frame
         self.space_pressed_last_frame = is_space_pressed
@@ -300,39 +438,46 @@ class Player(Dog):
         self.update_animation_state()
         self.animate()
 
-        # Apply physics (gravity, velocity, collisions)
+        # Apply physics (gravity, velocity, bounds, collisions)
         self.apply_physics()
 
-        # Boundary checks
-        if self.rect.left < 0:
-            self.rect.left = 0
-            self.x = float(self.rect.x)  # Update float position
-        if self.rect.right > NET_X:  # Player stays left of net
-            self.rect.right = NET_X
-            self.x = float(self.rect.x)  # Update float position
-
 
 class AI(Dog):
-    def __init__(self, x, y, speed, animations, ball_ref):
-        super().__init__(x, y, speed, animations)
+    __slots__ = ('ball', 'jump_cooldown', 'serve_timer', 'serve_delay', 'default_pos_x', 'track_margin', 'return_margin')
+
+    def __init__(self, x, y, speed, animations, ball_ref, gs):
+        super().__init__(x, y, speed, animations, gs)
+        self.min_x = NET_X + NET_WIDTH  # AI stays right of net
         self.ball = ball_ref # Reference to the ball sprite
         self.jump_cooldown = 0
         self.serve_timer = 0  # Timer for AI serving
         self.serve_delay = 60  # Frames to wait before serving (1 second)
 
-    def update(self):
-        global game_state, serve_power
+        # Constant decision thresholds, computed once instead of every frame
+        self.default_pos_x = SCREEN_WIDTH * 3 / 4  # Where the AI serves from and returns to
+        self.track_margin = self.rect.width * 0.3  # How far off the ball it tolerates before moving
+        self.return_margin = self.speed * 0.5  # How close to the default position counts as home
+
+    def reset(self):
+        """Resets movement state plus the AI's jump and serve timers."""
+        super().reset()
+        self.jump_cooldown = 0
+        self.serve_timer = 0
+
+    def update(self, _acceleration=ACCELERATION, _deceleration=DECELERATION,
+               _max_power=MAX_SERVE_POWER, _half_screen=SCREEN_WIDTH / 2):
+        gs = self.gs
+        default_pos_x = self.default_pos_x
 
         # Handle serving state for AI
-        if game_state == 'serving' and serve_side == 'ai':
+        if gs.state == 'serving' and gs.serve_side == 'ai':
             # Move to a good serving position
-            default_serve_pos_x = SCREEN_WIDTH * 3 / 4
-            if self.rect.centerx < default_serve_pos_x - 10:
-                self.dx += ACCELERATION * 0.4
-            elif self.rect.centerx > default_serve_pos_x + 10:
-                self.dx -= ACCELERATION * 0.4
+            if self.rect.centerx < default_pos_x - 10:
+                self.dx += _acceleration * 0.4
+            elif self.rect.centerx > default_pos_x + 10:
+                self.dx -= _acceleration * 0.4
             else:
-                self.dx *= DECELERATION  # Slow down when in position
+                self.dx *= _deceleration  # Slow down when in position
 
                 # Start the serve timer once in position
                 if self.serve_timer == 0:
@@ -342,28 +487,28 @@ class AI(Dog):
             if self.serve_timer > 0:
                 self.serve_timer -= 1
                 # AI charges serve power gradually
-                serve_power = MAX_SERVE_POWER * (1 - (self.serve_timer / self.serve_delay))
+                gs.serve_power = _max_power * (1 - (self.serve_timer / self.serve_delay))
 
                 # Serve when timer reaches zero
                 if self.serve_timer == 0:
                     # Serve with random power between 60-90%
-                    power = random.uniform(60, 90)
-                    ball.serve_with_power(serve_side, power)
-                    game_state = 'playing'
-                    serve_power = 0  # Reset serve power
+                    power = 60 + _rand() * 30
+                    self.ball.serve_with_power(gs.serve_side, power)
+                    gs.state = 'playing'
+                    gs.serve_power = 0  # Reset serve power
 
         # Normal gameplay AI
-        elif game_state == 'playing':
+        elif gs.state == 'playing':
             # Simple AI: Move towards the ball's x-position if it's on AI side or coming towards AI
             target_x = self.ball.rect.centerx
             ai_center = self.rect.centerx
 
             # Only actively move if ball is reasonably close or moving towards AI
-            if self.ball.dx < 0 or self.ball.rect.centerx > SCREEN_WIDTH / 2:
-                if ai_center < target_x - self.rect.width * 0.3: # Move right if ball is to the right
-                    self.dx += ACCELERATION * 0.8  # AI accelerates a bit slower than player
-                elif ai_center > target_x + self.rect.width * 0.3: # Move left if ball is to the left
-                    self.dx -= ACCELERATION * 0.8
+            if self.ball.dx < 0 or self.ball.rect.centerx > _half_screen:
+                if ai_center < target_x - self.track_margin: # Move right if ball is to the right
+                    self.dx += _acceleration * 0.8  # AI accelerates a bit slower than player
+                elif ai_center > target_x + self.track_margin: # Move left if ball is to the left
+                    self.dx -= _acceleration * 0.8
 
                 # Jump if the ball is above the AI and close enough horizontally
                 if (self.ball.rect.bottom < self.rect.top + 50 and
@@ -373,11 +518,10 @@ class AI(Dog):
                     self.jump_cooldown = 45  # Increased cooldown to make AI less aggressive
             else:
                 # If ball is far on player side, maybe slowly return to center
-                default_pos_x = SCREEN_WIDTH * 3 / 4
-                if ai_center < default_pos_x - self.speed * 0.5:
-                    self.dx += ACCELERATION * 0.4  # Gentle acceleration toward default position
-                elif ai_center > default_pos_x + self.speed * 0.5:
-                    self.dx -= ACCELERATION * 0.4
+                if ai_center < default_pos_x - self.return_margin:
+                    self.dx += _acceleration * 0.4  # Gentle acceleration toward default position
+                elif ai_center > default_pos_x + self.return_margin:
+                    self.dx -= _acceleration * 0.4
 
         # Decrement jump cooldown
         if self.jump_cooldown > 0:
@@ -387,97 +531,55 @@ class AI(Dog):
         self.update_animation_state()
         self.animate()
 
-        # Apply physics (gravity, velocity, collisions)
+        # Apply physics (gravity, velocity, bounds, collisions)
         self.apply_physics()
 
-        # Boundary checks
-        if self.rect.left < NET_X + NET_WIDTH: # AI stays right of net
-            self.rect.left = NET_X + NET_WIDTH
-            self.x = float(self.rect.x)  # Update float position
-        if self.rect.right > SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
-            self.x = float(self.rect.x)  # Update float position
-
 
 class Ball(pygame.sprite.Sprite):
-    def __init__(self, x, y):
+    __slots__ = ('gs', 'radius', 'image', 'rect', 'dx', 'dy', 'x', 'y')
+
+    def __init__(self, x, y, gs):
         super().__init__()
+        self.gs = gs # Shared GameState
         self.radius = 15
         # Create a surface for the ball
         self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA) # Use SRALPHA for transparency
         pygame.draw.circle(self.image, WHITE, (self.radius, self.radius), self.radius)
+        self.image = self.image.convert_alpha() # Match the display format for fast blits
         self.rect = self.image.get_rect(center=(x, y))
         self.dx = 0
         self.dy = 0
         self.x = float(self.rect.centerx) # Use float for precise position tracking
         self.y = float(self.rect.centery)
 
-    def update(self):
-        global game_state
-
-        # Only apply physics when in playing state
-        if game_state == 'playing':
-            # Apply gravity
-            self.dy += GRAVITY
-            # Update precise position
-            self.x += self.dx
-            self.y += self.dy
-            # Update rect position based on float values
-            self.rect.center = (round(self.x), round(self.y))
-        # In serving state, the ball stays in place (no gravity)
-
-        # Wall collisions
-        if self.rect.left <= 0:
-            self.rect.left = 0
-            self.x = float(self.rect.centerx) # Update float pos
-            self.dx *= -0.9 # Bounce with slight energy loss
-        if self.rect.right >= SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
-            self.x = float(self.rect.centerx) # Update float pos
-            self.dx *= -0.9
-
-        # Ceiling collision
-        if self.rect.top <= 0:
-            self.rect.top = 0
-            self.y = float(self.rect.centery) # Update float pos
-            self.dy *= -0.9
-
-        # Net collision (simple rect collision)
-        if self.rect.colliderect(NET_RECT):
-            # Determine hit side more accurately
-            overlap_x = min(self.rect.right - NET_RECT.left, NET_RECT.right - self.rect.left)
-            overlap_y = min(self.rect.bottom - NET_RECT.top, NET_RECT.bottom - self.rect.top)
-
-            if overlap_x < overlap_y : # Hit the side of the net
-                 self.dx *= -1.1 # Bounce horizontally, maybe faster
-                 # Nudge out
-                 if self.rect.centerx < NET_RECT.centerx:
-                     self.rect.right = NET_RECT.left - 1
-                 else:
-                     self.rect.left = NET_RECT.right + 1
-                 self.x = float(self.rect.centerx)
-            else: # Hit the top (or bottom, less likely)
-                 self.dy *= -0.9 # Bounce vertically
-                 # Nudge out
-                 if self.rect.centery < NET_RECT.centery: # Hit top
-                    self.rect.bottom = NET_RECT.top -1
-                 else: # Hit bottom (unlikely)
-                    self.rect.top = NET_RECT.bottom + 1
-                 self.y = float(self.rect.centery)
+    def update(self, _step=step_ball, _gravity=GRAVITY, _screen_w=SCREEN_WIDTH,
+               _net_l=NET_LEFT, _net_r=NET_RIGHT, _net_t=NET_TOP, _net_b=NET_BOTTOM):
+        # Only apply physics when in playing state (in serving state the ball stays in place)
+        if self.gs.state != 'playing':
+            return
 
+        rect = self.rect
+        self.x, self.y, self.dx, self.dy = _step(
+            self.x, self.y, self.dx, self.dy, _gravity, rect.width, rect.height,
+            _screen_w, _net_l, _net_r, _net_t, _net_b)
+        # Update rect position based on float values (x, y stay positive, so +0.5 rounds)
+        rect.center = (int(self.x + 0.5), int(self.y + 0.5))
 
     def check_ground_collision(self):
-        """Checks for ground collision and returns scoring side ('player' or 'ai') or None."""
-        if self.rect.bottom >= GROUND_Y:
-            self.rect.bottom = GROUND_Y
-            self.y = float(self.rect.centery)
+        """Checks for ground collision and returns the scoring side (SCORE_PLAYER or SCORE_AI) or SCORE_NONE."""
+        # Test the authoritative float position; only touch the rect on a hit.
+        # The -0.5 offsets match the rounded rect center the checks used to read.
+        rest_y = GROUND_Y - self.radius # Center y of a ball resting on the ground
+        if self.y >= rest_y - 0.5:
+            self.y = float(rest_y)
+            self.rect.centery = rest_y
             # self.dy *= -0.7 # Bounce effect if needed, but scoring happens first
 
-            if self.rect.centerx < SCREEN_WIDTH // 2:
-                return 'ai' # AI scored (ball landed on player side)
+            if self.x < SCREEN_WIDTH // 2 - 0.5:
+                return SCORE_AI # AI scored (ball landed on player side)
             else:
-                return 'player' # Player scored
-        return None
+                return SCORE_PLAYER # Player scored
+        return SCORE_NONE
 
     def reset(self, serve_side):
         """Resets ball position for the next serve without setting velocity."""
@@ -492,7 +594,7 @@ class Ball(pygame.sprite.Sprite):
             self.x = SCREEN_WIDTH * 3 / 4
             self.y = SCREEN_HEIGHT / 3
 
-        self.rect.center = (round(self.x), round(self.y))
+        self.rect.center = (int(self.x + 0.5), int(self.y + 0.5))
 
     def serve_with_power(self, serve_side, power):
         """Serves the ball with the given power (0-100)."""
@@ -505,23 +607,43 @@ class Ball(pygame.sprite.Sprite):
 
         # Apply power factor (more power = faster serve)
         if serve_side == 'player':
-            self.dx = base_dx * (0.5 + power_factor) + random.uniform(-0.5, 0.5)
-            self.dy = base_dy * (0.5 + power_factor) + random.uniform(-0.5, 0.5)
+            self.dx = base_dx * (0.5 + power_factor) + (_rand() - 0.5)
+            self.dy = base_dy * (0.5 + power_factor) + (_rand() - 0.5)
         else: # AI serves
-            self.dx = -base_dx * (0.5 + power_factor) + random.uniform(-0.5, 0.5)
-            self.dy = base_dy * (0.5 + power_factor) + random.uniform(-0.5, 0.5)
+            self.dx = -base_dx * (0.5 + power_factor) + (_rand() - 0.5)
+            self.dy = base_dy * (0.5 + power_factor) + (_rand() - 0.5)
 
 
 class Button:
+    __slots__ = ('rect', 'text', 'font', 'base_color', 'hover_color', 'hovered',
+                 'text_surf', 'base_surf', 'hover_surf')
+
     def __init__(self, x, y, width, height, text, font, base_color, hover_color):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.font = font
         self.base_color = base_color
         self.hover_color = hover_color
-        self.current_color = base_color
+        self.hovered = False
         self.text_surf = self.font.render(self.text, True, WHITE)
-        self.text_rect = self.text_surf.get_rect(center=self.rect.center)
+        # Pre-render both looks once; draw() just picks one
+        self.base_surf = self.render(base_color)
+        self.hover_surf = self.render(hover_color)
+
+    def render(self, color):
+        """Renders the button (fill, border and text) in the given color to a new surface."""
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = surf.get_rect()
+        _draw_rect(surf, color, local_rect, border_radius=10)
+        _draw_rect(surf, WHITE, local_rect, width=3, border_radius=10) # Border
+        surf.blit(self.text_surf, self.text_surf.get_rect(center=local_rect.center))
+        return surf.convert_alpha()
+
+    def set_base_color(self, color):
+        """Changes the base color, re-rendering only if it actually changed."""
+        if color != self.base_color:
+            self.base_color = color
+            self.base_surf = self.render(color)
 
     def handle_event(self, event):
         """Checks if the button was clicked."""
@@ -531,26 +653,45 @@ class Button:
         return False
 
     def update(self, mouse_pos):
-        """Updates hover state."""
-        if self.rect.collidepoint(mouse_pos):
-            self.current_color = self.hover_color
-        else:
-            self.current_color = self.base_color
+        """Updates hover state. Returns True if it changed (i.e. the button needs redrawing)."""
+        hovered = bool(self.rect.collidepoint(mouse_pos))
+        changed = hovered != self.hovered
+        self.hovered = hovered
+        return changed
 
     def draw(self, surface):
-        pygame.draw.rect(surface, self.current_color, self.rect, border_radius=10)
-        pygame.draw.rect(surface, WHITE, self.rect, width=3, border_radius=10) # Border
-        surface.blit(self.text_surf, self.text_rect)
+        surface.blit(self.hover_surf if self.hovered else self.base_surf, self.rect)
 
 
 # --- Game Setup ---
 pygame.init()
 pygame.font.init() # Initialize font module
 
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+# clock.tick(FPS) caps the frame rate every frame regardless of vsync. vsync=1 (honored
+# with SCALED, silently ignored where unavailable) only syncs flip() to the display, which
+# removes tearing and, when the refresh rate equals FPS, the busy-wait in tick().
+screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
 pygame.display.set_caption("Doggo Volleyball (Pygame)")
+
+# Only queue the event types the game handles, so event loops don't iterate over
+# floods of e.g. MOUSEMOTION events from high polling rate mice
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN, pygame.KEYUP])
 clock = pygame.time.Clock()
 
+# Pre-render the static court (sky, ground and net) once; each frame just blits it
+BACKGROUND = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+BACKGROUND.fill(SKY_BLUE)
+_draw_rect(BACKGROUND, GREEN, (0, GROUND_Y, SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_Y)) # Ground
+_draw_rect(BACKGROUND, WHITE, NET_RECT) # Net
+pygame.draw.line(BACKGROUND, GREY, (NET_RECT.left - 2, NET_RECT.top), (NET_RECT.right + 2, NET_RECT.top), 5) # Net top
+
+# Court image frozen at the start of a point pause, allocated once and redrawn per point
+PAUSE_SNAPSHOT = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+
+# Multiply color that dims the game over screen (same result as black at alpha 180)
+GAME_OVER_DIM = (75, 75, 75)
+
 # Load Fonts (Using default Pygame font)
 try:
     # Try loading a specific font if available (replace path if needed)
@@ -586,8 +727,8 @@ wolf_all_frames, _, _ = load_sprite_sheet(wolf_sheet, SPRITE_WIDTH, SPRITE_HEIGH
 if wolf_all_frames and len(wolf_all_frames[0]) >= 4:
     # Player uses first two sprites (0 and 1) - flip them horizontally
     player_frames = [
-        pygame.transform.flip(wolf_all_frames[0][0], True, False),
-        pygame.transform.flip(wolf_all_frames[0][1], True, False)
+        pygame.transform.flip(wolf_all_frames[0][0], True, False).convert_alpha(),
+        pygame.transform.flip(wolf_all_frames[0][1], True, False).convert_alpha()
     ]
 
     # AI uses last two sprites (2 and 3) with a red tint
@@ -599,26 +740,30 @@ if wolf_all_frames and len(wolf_all_frames[0]) >= 4:
         red_overlay = pygame.Surface(ai_frame.get_size(), pygame.SRCALPHA)
         red_overlay.fill((150, 50, 50, 100))  # Semi-transparent red
         ai_frame.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        ai_frames.append(ai_frame)
+        ai_frames.append(ai_frame.convert_alpha())
 
-    # Create new frame arrays
-    player_all_frames = [[player_frames[0], player_frames[1], player_frames[0], player_frames[1]]]
-    ai_all_frames = [[ai_frames[0], ai_frames[1], ai_frames[0], ai_frames[1]]]
+    # Create new frame arrays (two frames already cycle 0 -> 1 -> 0)
+    player_all_frames = [player_frames]
+    ai_all_frames = [ai_frames]
 else:
     # Fallback if sprite sheet doesn't have enough frames
     player_all_frames = wolf_all_frames
     ai_all_frames = wolf_all_frames
 
-# Create animation dictionaries - using the frames directly since we've already prepared them
+# Scale the frames to draw size once, instead of on every animation tick
+player_scaled_frames = scale_frames(player_all_frames[0], DOG_DRAW_WIDTH, DOG_DRAW_HEIGHT) if player_all_frames else []
+ai_scaled_frames = scale_frames(ai_all_frames[0], DOG_DRAW_WIDTH, DOG_DRAW_HEIGHT) if ai_all_frames else []
+
+# Create animation dictionaries - all states share the same pre-scaled frames
 player_animations = {
-    'idle': player_all_frames[0],
-    'walk': player_all_frames[0],
-    'run': player_all_frames[0],
+    'idle': player_scaled_frames,
+    'walk': player_scaled_frames,
+    'run': player_scaled_frames,
 }
 ai_animations = {
-    'idle': ai_all_frames[0],
-    'walk': ai_all_frames[0],
-    'run': ai_all_frames[0],
+    'idle': ai_scaled_frames,
+    'walk': ai_scaled_frames,
+    'run': ai_scaled_frames,
 }
 
 # Check if animations loaded correctly (at least idle should have something)
@@ -629,47 +774,92 @@ if not player_animations['idle'] or not ai_animations['idle']:
 
 
 # --- Game State Variables ---
-game_state = 'start_menu' # 'start_menu', 'options', 'how_to_play', 'playing', 'serving', 'point_pause', 'game_over'
-player_score = 0
-ai_score = 0
-winning_score = 5
-serve_side = 'player' # 'player' or 'ai'
-winner = None
+GS = GameState()
 
-# Serve mechanics
-serve_power = 0  # Current serve power (0-100)
-MAX_SERVE_POWER = 100  # Maximum serve power
-SERVE_POWER_RATE = 2  # How fast the power meter increases
-serve_charging = False  # Whether the player is currently charging a serve
-point_pause_timer = 0  # Timer for pause between points
-POINT_PAUSE_DURATION = 60  # Frames to pause after a point (1 second at 60 FPS)
-
-# --- Create Sprites and Groups ---
-all_sprites = pygame.sprite.Group()
-dogs = pygame.sprite.Group() # Group for player and AI for collision checks
+# Power meter layout and color thresholds
+METER_W, METER_H = 300, 20
+METER_X = (SCREEN_WIDTH - METER_W) // 2
+METER_Y = 100
+METER_BG_RECT = pygame.Rect(METER_X, METER_Y, METER_W, METER_H)
+PWR_T1 = MAX_SERVE_POWER * 0.33 # Green below this
+PWR_T2 = MAX_SERVE_POWER * 0.66 # Yellow below this, red above
+POINT_PAUSE_MS = 1000  # How long to pause after a point (milliseconds)
 
-ball = Ball(SCREEN_WIDTH // 4, SCREEN_HEIGHT // 2)
-player = Player(SCREEN_WIDTH / 4 - DOG_DRAW_WIDTH / 2, GROUND_Y, 5, player_animations)
-ai = AI(SCREEN_WIDTH * 3 / 4 - DOG_DRAW_WIDTH / 2, GROUND_Y, 3.5, ai_animations, ball) # Pass ball reference to AI
+# --- Create Sprites ---
+ball = Ball(SCREEN_WIDTH // 4, SCREEN_HEIGHT // 2, GS)
+player = Player(SCREEN_WIDTH / 4 - DOG_DRAW_WIDTH / 2, GROUND_Y, 5, player_animations, GS)
+ai = AI(SCREEN_WIDTH * 3 / 4 - DOG_DRAW_WIDTH / 2, GROUND_Y, 3.5, ai_animations, ball, GS) # Pass ball reference to AI
 
-all_sprites.add(player, ai, ball)
-dogs.add(player, ai)
+draw_list = (player, ai, ball) # Plain tuple: update and draw order, no Group bookkeeping
+# Persistent [image, rect] pairs for the render loop. Rects are mutated in place,
+# so only the dog images (which change on animation ticks) need refreshing per frame.
+blit_list = [[sprite.image, sprite.rect] for sprite in draw_list]
 
 
 # --- Menu Functions ---
 
-def draw_text(text, font, color, surface, x, y, center=True):
-    """Helper function to draw text."""
+def render_text(text, font, color, x, y, center=True):
+    """Helper function to render text. Returns the surface and its positioned rect for reuse."""
     text_obj = font.render(text, True, color)
     text_rect = text_obj.get_rect()
     if center:
         text_rect.center = (x, y)
     else:
         text_rect.topleft = (x, y)
-    surface.blit(text_obj, text_rect)
+    return text_obj, text_rect
+
+def draw_text(text, font, color, surface, x, y, center=True):
+    """Helper function to draw text."""
+    surface.blit(*render_text(text, font, color, x, y, center))
+
+# Constant HUD text, rendered once instead of every frame
+SERVE_PLAYER_TEXT = render_text("Hold SPACE to charge serve, release to serve", button_font, WHITE, SCREEN_WIDTH // 2, 70)
+SERVE_AI_TEXT = render_text("AI is preparing to serve...", button_font, WHITE, SCREEN_WIDTH // 2, 70)
+
+def draw_buttons(buttons, mouse_pos):
+    """Sets each button's hover state and draws it."""
+    for button in buttons:
+        button.update(mouse_pos)
+        button.draw(screen)
+
+def redraw_changed_buttons(buttons, mouse_pos):
+    """Redraws only the buttons whose hover state changed and updates just those screen areas."""
+    dirty_rects = []
+    for button in buttons:
+        if button.update(mouse_pos):
+            button.draw(screen)
+            dirty_rects.append(button.rect)
+    if dirty_rects:
+        pygame.display.update(dirty_rects)
+
+def run_menu(draw_static, buttons, on_click):
+    """Runs a menu until one of its buttons is clicked.
+
+    The menu is drawn once (draw_static for everything but the buttons); after
+    that only buttons whose hover state changed are redrawn. on_click is called
+    with the clicked button and should set GS.state for whatever comes next.
+    """
+    draw_static()
+    mouse_pos = pygame.mouse.get_pos() # Then kept current from MOUSEMOTION events
+    draw_buttons(buttons, mouse_pos)
+    pygame.display.flip()
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            for button in buttons:
+                if button.handle_event(event):
+                    on_click(button)
+                    return
+
+        redraw_changed_buttons(buttons, mouse_pos)
+        clock.tick(MENU_FPS) # Limit FPS even in menus
 
 def start_menu():
-    global game_state
     title_text = "Doggo Volleyball!"
     start_button = Button(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 - 50, 300, 60, "Start Game", button_font, GREEN, GREY)
     options_button = Button(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 30, 300, 60, "Options", button_font, GREEN, GREY)
@@ -679,39 +869,25 @@ def start_menu():
 
     buttons = [start_button, options_button, how_to_play_button, quit_button]
 
-    while game_state == 'start_menu':
-        mouse_pos = pygame.mouse.get_pos()
+    def draw_static():
         screen.fill(BLACK) # Menu background
         draw_text(title_text, title_font, GOLD, screen, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if start_button.handle_event(event):
-                game_state = 'playing' # Start the game
-                reset_game() # Ensure game resets before starting
-                return
-            if options_button.handle_event(event):
-                game_state = 'options'
-                return
-            if how_to_play_button.handle_event(event):
-                 game_state = 'how_to_play'
-                 return
-            if quit_button.handle_event(event):
-                 pygame.quit()
-                 sys.exit()
-
-
-        for button in buttons:
-            button.update(mouse_pos)
-            button.draw(screen)
+    def on_click(button):
+        if button is start_button:
+            GS.state = 'playing' # Start the game
+            reset_game() # Ensure game resets before starting
+        elif button is options_button:
+            GS.state = 'options'
+        elif button is how_to_play_button:
+            GS.state = 'how_to_play'
+        else: # Quit
+            pygame.quit()
+            sys.exit()
 
-        pygame.display.flip()
-        clock.tick(FPS) # Limit FPS even in menus
+    run_menu(draw_static, buttons, on_click)
 
 def options_menu():
-    global game_state, winning_score
     title_text = "Options"
     options = [3, 5, 7, 10]
 
@@ -723,133 +899,93 @@ def options_menu():
 
     back_button = Button(SCREEN_WIDTH//2 - 100, button_y + len(options) * 70, 200, 50, "Back", button_font, (200, 0, 0), GREY)
 
-    while game_state == 'options':
-        mouse_pos = pygame.mouse.get_pos()
+    buttons = option_buttons + [back_button]
+
+    # Highlight selected option (selecting one leaves the menu, so this is set once)
+    for i, button in enumerate(option_buttons):
+         if options[i] == GS.winning_score:
+             button.set_base_color((0, 100, 0)) # Darker green for selected
+         else:
+             button.set_base_color(GREEN)
+
+    def draw_static():
         screen.fill(BLACK)
         draw_text(title_text, title_font, GOLD, screen, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if back_button.handle_event(event):
-                 game_state = 'start_menu'
-                 return
-            for i, button in enumerate(option_buttons):
-                 if button.handle_event(event):
-                     winning_score = options[i]
-                     print(f"Winning score set to: {winning_score}")
-                     game_state = 'start_menu'
-                     return # Go back to start menu after selection
-
-
-        for i, button in enumerate(option_buttons):
-             # Highlight selected option
-             if options[i] == winning_score:
-                 button.base_color = (0, 100, 0) # Darker green for selected
-             else:
-                 button.base_color = GREEN
-             button.update(mouse_pos)
-             button.draw(screen)
-
-        back_button.update(mouse_pos)
-        back_button.draw(screen)
-
-        pygame.display.flip()
-        clock.tick(FPS)
+    def on_click(button):
+        if button is not back_button:
+            GS.winning_score = options[option_buttons.index(button)]
+            print(f"Winning score set to: {GS.winning_score}")
+        GS.state = 'start_menu' # Go back to start menu after selection
+
+    run_menu(draw_static, buttons, on_click)
 
 def how_to_play_menu():
-    global game_state
     title_text = "How To Play"
     rules = [
         "Move Your Dog: Left/Right Arrow Keys",
         "Objective: Hit the ball over the net.",
         "Scoring: Score if the ball lands on the opponent's side.",
-        f"Win: First to {winning_score} points wins!",
+        f"Win: First to {GS.winning_score} points wins!",
         "Serve: After a score, the non-scoring player serves.",
     ]
     back_button = Button(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT - 100, 200, 50, "Back", button_font, (200, 0, 0), GREY)
 
-    while game_state == 'how_to_play':
-        mouse_pos = pygame.mouse.get_pos()
+    def draw_static():
         screen.fill(BLACK)
         draw_text(title_text, title_font, GOLD, screen, SCREEN_WIDTH // 2, 100)
 
-        # Display rules
+        # Display rules (one batched call for all pre-positioned lines)
+        rule_texts = []
         rule_y = 200
         for line in rules:
-             draw_text(line, rules_font, WHITE, screen, SCREEN_WIDTH // 2, rule_y)
+             rule_texts.append(render_text(line, rules_font, WHITE, SCREEN_WIDTH // 2, rule_y))
              rule_y += 40
+        screen.blits(rule_texts, doreturn=False)
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if back_button.handle_event(event):
-                 game_state = 'start_menu'
-                 return
-
-        back_button.update(mouse_pos)
-        back_button.draw(screen)
+    def on_click(button):
+        GS.state = 'start_menu'
 
-        pygame.display.flip()
-        clock.tick(FPS)
+    run_menu(draw_static, [back_button], on_click)
 
 
 def game_over_menu():
-    global game_state, winner
-    message = f"{winner} Wins!" if winner else "Game Over!"
+    message = f"{GS.winner} Wins!" if GS.winner else "Game Over!"
     restart_button = Button(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2, 300, 60, "Play Again?", button_font, GREEN, GREY)
     quit_button = Button(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 80, 300, 60, "Quit to Menu", button_font, (200,0,0), GREY)
     buttons = [restart_button, quit_button]
 
-    while game_state == 'game_over':
-        mouse_pos = pygame.mouse.get_pos()
-        # Optionally draw semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0,0))
-
+    def draw_static():
+        # Dim the final game frame and draw the message over it
+        screen.fill(GAME_OVER_DIM, special_flags=pygame.BLEND_RGB_MULT)
         draw_text(message, title_font, GOLD, screen, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if restart_button.handle_event(event):
-                 game_state = 'playing' # Restart
-                 reset_game()
-                 return
-            if quit_button.handle_event(event):
-                 game_state = 'start_menu' # Back to main menu
-                 return
-
-        for button in buttons:
-            button.update(mouse_pos)
-            button.draw(screen)
+    def on_click(button):
+        if button is restart_button:
+            GS.state = 'playing' # Restart
+            reset_game()
+        else:
+            GS.state = 'start_menu' # Back to main menu
 
-        pygame.display.flip()
-        clock.tick(FPS)
+    run_menu(draw_static, buttons, on_click)
 
 # --- Helper Functions ---
 def reset_game():
     """Resets scores, positions, and serve."""
-    global player_score, ai_score, serve_side, winner, serve_power, serve_charging, game_state, point_pause_timer
 
     # Reset scores
-    player_score = 0
-    ai_score = 0
-    winner = None
+    GS.player_score = 0
+    GS.ai_score = 0
+    GS.winner = None
 
     # Reset serve mechanics
-    serve_power = 0
-    serve_charging = False
-    point_pause_timer = 0
+    GS.serve_power = 0
+    GS.serve_charging = False
+    GS.pause_end_ms = 0
 
     # Reset player and AI
     player.reset()
     ai.reset()
-    ai_additional_reset()  # Call the additional AI reset function
 
     # Reset positions
     player.rect.bottomleft = (SCREEN_WIDTH / 4 - player.rect.width / 2, GROUND_Y)
@@ -862,49 +998,43 @@ def reset_game():
     ai.y = float(ai.rect.y)
 
     # Reset ball and serve
-    serve_side = 'player' if random.random() < 0.5 else 'ai'
-    ball.reset(serve_side)
+    GS.serve_side = 'player' if random.random() < 0.5 else 'ai'
+    ball.reset(GS.serve_side)
 
     # Set game state to serving
-    game_state = 'serving'
-
-
-# Add a basic reset method to Dog class if needed, or handle in reset_game
-def dog_reset(dog_instance):
-     dog_instance.frame_index = 0
-     dog_instance.moving_timer = 0
-     dog_instance.state = 'idle'
-     dog_instance.dx = 0
-     dog_instance.dy = 0
-     dog_instance.is_jumping = False
-     dog_instance.is_grounded = True
-     # Reset position in reset_game
-
-player.reset = lambda: dog_reset(player)
-ai.reset = lambda: dog_reset(ai)
-
-# Additional AI reset
-def ai_additional_reset():
-    ai.jump_cooldown = 0  # Reset AI jump cooldown
-    ai.serve_timer = 0    # Reset AI serve timer
+    GS.state = 'serving'
+
+def draw_court(surface):
+    """Draws the background and sprites (everything except the HUD) onto surface."""
+    surface.blit(BACKGROUND, (0, 0)) # Sky, ground and net
+
+    # Draw Sprites (one batched call instead of Group.draw's per-sprite blit loop)
+    blit_list[0][0] = player.image
+    blit_list[1][0] = ai.image
+    surface.blits(blit_list, doreturn=False)
+
+# Menu state -> function that runs that menu until the state changes
+MENU_DISPATCH = {
+    'start_menu': start_menu,
+    'options': options_menu,
+    'how_to_play': how_to_play_menu,
+    'game_over': game_over_menu,
+}
 
 # --- Main Game Loop ---
 running = True
+last_score = None # (player_score, ai_score) the cached score surface was rendered for
+pause_text_surf = pause_text_rect = None # "... scores!" message rendered at the start of a point pause
 while running:
 
     # --- Handle Menu States ---
-    if game_state == 'start_menu':
-        start_menu()
+    menu = MENU_DISPATCH.get(GS.state)
+    if menu:
+        # Menus track the mouse via motion events; gameplay keeps them blocked
+        pygame.event.set_allowed(pygame.MOUSEMOTION)
+        menu()
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
         continue # Skip rest of loop until state changes
-    elif game_state == 'options':
-        options_menu()
-        continue
-    elif game_state == 'how_to_play':
-         how_to_play_menu()
-         continue
-    elif game_state == 'game_over':
-        game_over_menu()
-        continue
 
     # --- Handle Game Events ---
     for event in pygame.event.get():
@@ -914,129 +1044,115 @@ while running:
 
     # --- Game Updates ---
     # Handle point pause state
-    if game_state == 'point_pause':
-        point_pause_timer -= 1
-        if point_pause_timer <= 0:
-            game_state = 'serving'
+    if GS.state == 'point_pause':
+        if pygame.time.get_ticks() >= GS.pause_end_ms:
+            GS.state = 'serving'
+            # Position the ball for the next serve only now that the pause is over
+            ball.reset(GS.serve_side)
             # Reset AI serve timer when transitioning to serving state
-            if serve_side == 'ai':
+            if GS.serve_side == 'ai':
                 ai.serve_timer = 0
 
     # Update sprites in playing or serving states
-    if game_state == 'playing' or game_state == 'serving':
-        all_sprites.update() # Calls update() on player, ai, ball
-
-        # Ball-Dog Collision
-        if pygame.sprite.spritecollide(ball, dogs, False):
-             # More precise collision check might be needed
-             collided_dog = None
-             if ball.rect.colliderect(player.rect):
-                 collided_dog = player
-             elif ball.rect.colliderect(ai.rect):
-                 collided_dog = ai
-
-             if collided_dog:
-                 # Calculate hit angle based on relative position
-                 hit_angle = (ball.rect.centerx - collided_dog.rect.centerx) / (collided_dog.rect.width / 2) # -1 to 1
+    if GS.state == 'playing' or GS.state == 'serving':
+        Player.keys = _get_pressed() # Read keyboard state once per frame
+        for sprite in draw_list:
+            sprite.update() # Calls update() on player, ai, ball
+
+        # Ball-Dog Collision (only two dogs, so test the rect pairs directly)
+        ball_rect = ball.rect
+        if ball_rect.colliderect(player.rect):
+            collided_dog = player
+        elif ball_rect.colliderect(ai.rect):
+            collided_dog = ai
+        else:
+            collided_dog = None
 
-                 # Add dog's momentum to the ball
-                 ball.dx = hit_angle * 7 + (collided_dog.dx * 0.6)  # Bounce angle depends on hit location + dog's momentum
+        if collided_dog:
+            # Random bounce variation from the jitter table
+            jitter = _JITTER[_jitter_i & 255]
+            _jitter_i += 1
 
-                 # Stronger bounce if dog is moving up (jumping)
-                 if collided_dog.dy < 0:  # Dog is moving upward
-                     ball.dy = -10 - random.uniform(0, 2) - abs(collided_dog.dy * 0.3)  # Extra bounce from jump
-                 else:
-                     ball.dy = -8 - random.uniform(0, 2)  # Standard bounce
+            dog_rect = collided_dog.rect
+            ball.dx, ball.dy = compute_hit(ball_rect.centerx, dog_rect.centerx, dog_rect.width,
+                                           collided_dog.dx, collided_dog.dy, jitter)
 
-                 # Move ball out of dog
-                 ball.y = collided_dog.rect.top - ball.radius - 1
-                 ball.rect.centery = round(ball.y)
+            # Move ball out of dog
+            ball.y = dog_rect.top - ball.radius - 1
+            ball.rect.centery = int(ball.y + 0.5)
 
 
         # Ball-Ground Collision / Scoring
         score_result = ball.check_ground_collision()
         if score_result:
-            if score_result == 'player':
-                player_score += 1
-                serve_side = 'ai' # AI serves next
+            if score_result == SCORE_PLAYER:
+                GS.player_score += 1
+                GS.serve_side = 'ai' # AI serves next
             else: # AI scored
-                ai_score += 1
-                serve_side = 'player' # Player serves next
+                GS.ai_score += 1
+                GS.serve_side = 'player' # Player serves next
 
             # Check for win
-            if player_score >= winning_score:
-                winner = "Player"
-                game_state = 'game_over'
-            elif ai_score >= winning_score:
-                winner = "AI"
-                game_state = 'game_over'
+            if GS.player_score >= GS.winning_score:
+                GS.winner = "Player"
+                GS.state = 'game_over'
+            elif GS.ai_score >= GS.winning_score:
+                GS.winner = "AI"
+                GS.state = 'game_over'
             else:
                 # Start point pause
-                game_state = 'point_pause'
-                point_pause_timer = POINT_PAUSE_DURATION
-                # Reset ball position but don't serve yet
-                ball.reset(serve_side)
+                GS.state = 'point_pause'
+                GS.pause_end_ms = pygame.time.get_ticks() + POINT_PAUSE_MS
+                # Nothing moves during the pause, so draw the court once and reuse it
+                draw_court(PAUSE_SNAPSHOT)
+                # The AI serves next if the player scored, and vice versa
+                pause_text = "Player scores!" if GS.serve_side == 'ai' else "AI scores!"
+                pause_text_surf, pause_text_rect = render_text(pause_text, score_font, GOLD, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)
 
     # --- Drawing ---
-    screen.fill(SKY_BLUE) # Background
-
-    # Draw Ground
-    pygame.draw.rect(screen, GREEN, (0, GROUND_Y, SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_Y))
-
-    # Draw Net
-    pygame.draw.rect(screen, WHITE, NET_RECT)
-    pygame.draw.line(screen, GREY, (NET_RECT.left - 2, NET_RECT.top), (NET_RECT.right + 2, NET_RECT.top), 5) # Net top
-
-    # Draw Sprites
-    all_sprites.draw(screen)
+    if GS.state == 'point_pause':
+        screen.blit(PAUSE_SNAPSHOT, (0, 0)) # Court frozen when the point was scored
+    else:
+        draw_court(screen)
 
-    # Draw Score
-    score_text = f"Player: {player_score} - AI: {ai_score}"
-    draw_text(score_text, score_font, WHITE, screen, SCREEN_WIDTH // 2, 30)
+    # Draw Score (re-rendered only when the score changes)
+    if (GS.player_score, GS.ai_score) != last_score:
+        last_score = (GS.player_score, GS.ai_score)
+        score_surf, score_rect = render_text(f"Player: {GS.player_score} - AI: {GS.ai_score}", score_font, WHITE, SCREEN_WIDTH // 2, 30)
+    screen.blit(score_surf, score_rect)
 
     # Draw serve instructions when in serving state
-    if game_state == 'serving':
-        if serve_side == 'player':
-            instruction_text = "Hold SPACE to charge serve, release to serve"
-            draw_text(instruction_text, button_font, WHITE, screen, SCREEN_WIDTH // 2, 70)
+    if GS.state == 'serving':
+        if GS.serve_side == 'player':
+            screen.blit(*SERVE_PLAYER_TEXT)
 
             # Only draw power meter when actively charging a serve
-            if serve_charging:
-                # Draw power meter
-                meter_width = 300
-                meter_height = 20
-                meter_x = (SCREEN_WIDTH - meter_width) // 2
-                meter_y = 100
-
+            if GS.serve_charging:
                 # Draw meter background
-                pygame.draw.rect(screen, GREY, (meter_x, meter_y, meter_width, meter_height))
+                _draw_rect(screen, GREY, METER_BG_RECT)
 
-                # Draw filled portion based on serve_power
-                fill_width = int((serve_power / MAX_SERVE_POWER) * meter_width)
+                # Draw filled portion based on serve power
+                serve_power = GS.serve_power
+                fill_width = int((serve_power / MAX_SERVE_POWER) * METER_W)
 
                 # Color changes from green to yellow to red as power increases
-                if serve_power < MAX_SERVE_POWER * 0.33:
+                if serve_power < PWR_T1:
                     meter_color = (0, 255, 0)  # Green
-                elif serve_power < MAX_SERVE_POWER * 0.66:
+                elif serve_power < PWR_T2:
                     meter_color = (255, 255, 0)  # Yellow
                 else:
                     meter_color = (255, 0, 0)  # Red
 
-                pygame.draw.rect(screen, meter_color, (meter_x, meter_y, fill_width, meter_height))
+                _draw_rect(screen, meter_color, (METER_X, METER_Y, fill_width, METER_H))
 
                 # Draw meter border
-                pygame.draw.rect(screen, WHITE, (meter_x, meter_y, meter_width, meter_height), 2)
+                _draw_rect(screen, WHITE, METER_BG_RECT, 2)
         else:
-            instruction_text = "AI is preparing to serve..."
-            draw_text(instruction_text, button_font, WHITE, screen, SCREEN_WIDTH // 2, 70)
+            screen.blit(*SERVE_AI_TEXT)
 
     # Draw point pause message
-    if game_state == 'point_pause':
-        if serve_side == 'ai':  # Player scored last, so AI serves next
-            pause_text = "Player scores!"
-        else:  # AI scored last, so player serves next
-            pause_text = "AI scores!"
-        draw_text(pause_text, score_font, GOLD, screen, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)
+    if GS.state == 'point_pause':
+        screen.blit(pause_text_surf, pause_text_rect)
 
     # --- Update Display ---
     pygame.display.flip()